@@ -6,84 +6,86 @@ Run this for a fast demonstration of the agent's capabilities
 
 import sys
 import os
+from types import MappingProxyType
+from typing import Mapping
 
 # Add the current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from interview_prep_agent import InterviewPrepAgent, JobInput
 
+# Sample job descriptions
+EXAMPLES: Mapping[str, dict] = MappingProxyType({
+    "1": {
+        "company": "Google",
+        "role": "Software Engineer (SDE-1)",
+        "jd": """
+        Software Engineer - Google
+        
+        We are looking for a Software Engineer to join our team and help build the next generation of products.
+        
+        Requirements:
+        - Bachelor's degree in Computer Science or equivalent
+        - 1+ years of software development experience
+        - Experience with Python, Java, or C++
+        - Knowledge of data structures and algorithms
+        - Experience with distributed systems
+        - Strong problem-solving skills
+        """
+    },
+    "2": {
+        "company": "Microsoft", 
+        "role": "Data Scientist",
+        "jd": """
+        Data Scientist - Microsoft Azure AI
+        
+        Join our Azure AI team to build intelligent solutions.
+        
+        Requirements:
+        - PhD or Master's in Data Science, Statistics, or Computer Science
+        - 3+ years of experience in machine learning
+        - Proficiency in Python and R
+        - Experience with TensorFlow, PyTorch, Scikit-learn
+        - Strong knowledge of statistics
+        - Experience with Azure, AWS, or GCP
+        """
+    },
+    "3": {
+        "company": "TechFlow",
+        "role": "Full Stack Developer", 
+        "jd": """
+        Full Stack Developer - TechFlow (YC-backed startup)
+        
+        We're a fast-growing fintech startup looking for a talented developer.
+        
+        Requirements:
+        - 2-4 years of full stack development experience
+        - Strong proficiency in JavaScript/TypeScript
+        - Experience with React and Node.js
+        - Database experience with PostgreSQL
+        - Understanding of RESTful APIs
+        - AWS experience preferred
+        """
+    }
+})
+
 def run_demo():
     """Run a quick demo with pre-configured examples"""
     
     print("🎯 AI Interview Preparation Roadmap Generator - DEMO")
     print("=" * 60)
     
-    # Sample job descriptions
-    examples = {
-        "1": {
-            "company": "Google",
-            "role": "Software Engineer (SDE-1)",
-            "jd": """
-            Software Engineer - Google
-            
-            We are looking for a Software Engineer to join our team and help build the next generation of products.
-            
-            Requirements:
-            - Bachelor's degree in Computer Science or equivalent
-            - 1+ years of software development experience
-            - Experience with Python, Java, or C++
-            - Knowledge of data structures and algorithms
-            - Experience with distributed systems
-            - Strong problem-solving skills
-            """
-        },
-        "2": {
-            "company": "Microsoft", 
-            "role": "Data Scientist",
-            "jd": """
-            Data Scientist - Microsoft Azure AI
-            
-            Join our Azure AI team to build intelligent solutions.
-            
-            Requirements:
-            - PhD or Master's in Data Science, Statistics, or Computer Science
-            - 3+ years of experience in machine learning
-            - Proficiency in Python and R
-            - Experience with TensorFlow, PyTorch, Scikit-learn
-            - Strong knowledge of statistics
-            - Experience with Azure, AWS, or GCP
-            """
-        },
-        "3": {
-            "company": "TechFlow",
-            "role": "Full Stack Developer", 
-            "jd": """
-            Full Stack Developer - TechFlow (YC-backed startup)
-            
-            We're a fast-growing fintech startup looking for a talented developer.
-            
-            Requirements:
-            - 2-4 years of full stack development experience
-            - Strong proficiency in JavaScript/TypeScript
-            - Experience with React and Node.js
-            - Database experience with PostgreSQL
-            - Understanding of RESTful APIs
-            - AWS experience preferred
-            """
-        }
-    }
-    
     print("Choose an example to analyze:")
-    for key, example in examples.items():
+    for key, example in EXAMPLES.items():
         print(f"{key}. {example['company']} - {example['role']}")
     
     choice = input("\nEnter your choice (1-3): ").strip()
     
-    if choice not in examples:
+    if choice not in EXAMPLES:
         print("Invalid choice. Using Google example.")
         choice = "1"
     
-    selected = examples[choice]
+    selected = EXAMPLES[choice]
     
     print(f"\n🔍 Analyzing: {selected['role']} at {selected['company']}")
     print("=" * 60)
@@ -4,14 +4,65 @@ AI Research Agent for Interview Preparation Roadmaps
 A multi-agent system that generates comprehensive interview preparation roadmaps
 """
 
-import google.generativeai as genai
+import asyncio
+import functools
+import hashlib
 import json
 import re
 import os
-import glob
-from typing import List, Dict, Optional, Any
-from pydantic import BaseModel, Field
-from datetime import datetime
+import shelve
+import string
+import sys
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import List, Dict, Optional, Any, Tuple
+from pydantic import BaseModel, Field, ValidationError
+
+# Aho-Corasick automaton for company lookups, falls back to a linear scan
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# orjson speeds up (de)serialization, falls back to the standard library
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Compiled once; only used when raw_decode cannot parse from the first bracket
+_JSON_DECODER = json.JSONDecoder()
+_JSON_RE = {
+    '{': re.compile(r'\{.*\}', re.DOTALL),
+    '[': re.compile(r'\[.*\]', re.DOTALL),
+}
+
+def _extract_json(text: str, opener: str = '{') -> Optional[Any]:
+    """Decode the first JSON object (or array, with opener='[') embedded in model output"""
+    
+    idx = text.find(opener)
+    if idx == -1:
+        return None
+    
+    try:
+        return _JSON_DECODER.raw_decode(text, idx)[0]
+    except json.JSONDecodeError:
+        pass
+    
+    json_match = _JSON_RE[opener].search(text, idx)
+    return _json_loads(json_match.group()) if json_match else None
+
+def _jd_cache_key(role: str, job_description: str) -> str:
+    """Cache key for a parsed job description: role plus a blake2b digest of the text"""
+    
+    return f"{role}:{hashlib.blake2b(job_description.encode(), digest_size=16).hexdigest()}"
+
+def _build_parse_prompt(job_description: str, role: str) -> str:
+    """Single job description prompt"""
+    
+    return _PARSE_PROMPT.format(role=role, job_description=job_description, json_format=_SKILLS_JSON_FORMAT)
 
 # Load environment variables from .env file if it exists
 try:
@@ -23,6 +74,59 @@ except ImportError:
 # Configure Gemini API
 GEMINI_API_KEY = os.getenv('GEMINI_API_KEY', 'YOUR_GEMINI_API_KEY_HERE')  # Set via environment variable
 DEMO_MODE = True  # Set to False when you have a real API key
+MAX_CONCURRENT_REQUESTS = 48  # Cap on in-flight async model calls
+JD_CACHE_PATH = os.path.expanduser("~/.cache/interview_prep/jd_cache.db")  # Parsed JDs persisted across runs; grows without limit, delete to reset
+JD_MEMORY_CACHE_SIZE = 256  # Parsed JDs kept in memory per agent (least recently used evicted)
+
+# Prompts for job description parsing; the batched variant asks for one object per description
+_SKILLS_JSON_FORMAT = """{
+    "technical_skills": [list of technical skills],
+    "soft_skills": [list of soft skills],
+    "tools_technologies": [list of tools/technologies],
+    "responsibilities": [list of key responsibilities],
+    "experience_level": "Entry/Mid/Senior/Principal"
+}"""
+
+_PARSE_PROMPT = """
+Analyze this job description for {role} and extract information in JSON format:
+
+{job_description}
+
+Extract:
+{json_format}
+"""
+
+_BATCH_PARSE_PROMPT = """
+Analyze the following {count} job descriptions and return a JSON array of length {count},
+one object per job description in the same order:
+
+{descriptions}
+
+Each object must have this format:
+{json_format}
+"""
+
+# Keywords recognised by demo mode skill extraction
+DEMO_TECH_KEYWORDS = (
+    "python", "java", "javascript", "react", "node.js", "sql", "aws", "docker",
+    "kubernetes", "machine learning", "data structures", "algorithms",
+)
+
+# Punctuation is folded to spaces so keywords match on whole tokens
+_PUNCT_TABLE = str.maketrans({c: ' ' for c in string.punctuation})
+
+# (keyword, normalized form, is multi-token phrase) for each demo keyword
+_DEMO_KEYWORD_MATCHERS = tuple(
+    (keyword, ' '.join(parts), len(parts) > 1)
+    for keyword, parts in ((k, k.translate(_PUNCT_TABLE).split()) for k in DEMO_TECH_KEYWORDS)
+)
+
+# "N+ years" requirements, used to detect mid-level roles in demo mode
+_EXPERIENCE_RE = re.compile(r'\b(\d+)\+\s*years\b', re.IGNORECASE)
+
+# Timeline lookup tables used by _estimate_timeline
+_BASE_WEEKS = MappingProxyType({"Easy": 4, "Medium": 8, "Hard": 12})
+_EXPERIENCE_MULT = MappingProxyType({"Entry": 1.5, "Mid": 1.0, "Senior": 0.8})
 
 # Data Models
 class JobInput(BaseModel):
@@ -60,6 +164,21 @@ class CompanyInsights(BaseModel):
     difficulty_level: str = Field(description="General difficulty level")
     interview_focus: List[str] = Field(description="Interview focus areas")
 
+# Interview round templates as (type, topics, duration); models are built fresh per roadmap
+BIG_TECH_ROUNDS = (
+    ("Phone Screening", ("Resume", "Basic Technical"), "30 min"),
+    ("Coding Round 1", ("Arrays", "Strings", "Hash Maps"), "45 min"),
+    ("Coding Round 2", ("Dynamic Programming", "Graphs"), "45 min"),
+    ("System Design", ("Scalability", "Database Design"), "60 min"),
+    ("Behavioral", ("Leadership", "Teamwork"), "30 min"),
+)
+
+STANDARD_ROUNDS = (
+    ("Initial Screening", ("Background", "Interest"), "30 min"),
+    ("Technical Interview", ("Problem Solving", "Code Review"), "60 min"),
+    ("Manager Round", ("Experience", "Culture Fit"), "45 min"),
+)
+
 class InterviewPrepAgent:
     """Main AI agent for generating interview preparation roadmaps"""
     
@@ -67,6 +186,8 @@ class InterviewPrepAgent:
         self.demo_mode = demo_mode
         
         if not demo_mode:
+            # Imported lazily so demo mode skips the gRPC/protobuf startup cost
+            import google.generativeai as genai
             genai.configure(api_key=api_key)
             self.model = genai.GenerativeModel('gemini-1.5-flash')
         else:
@@ -74,7 +195,7 @@ class InterviewPrepAgent:
             print("🔧 Running in DEMO MODE - using predefined responses")
         
         # Company profiles database
-        self.company_profiles = {
+        self.company_profiles = MappingProxyType({
             "google": {"type": "FAANG", "difficulty": "Hard", "focus": ["Algorithms", "System Design"]},
             "meta": {"type": "FAANG", "difficulty": "Hard", "focus": ["Algorithms", "System Design"]},
             "facebook": {"type": "FAANG", "difficulty": "Hard", "focus": ["Algorithms", "System Design"]},
@@ -84,7 +205,15 @@ class InterviewPrepAgent:
             "microsoft": {"type": "Big Tech", "difficulty": "Hard", "focus": ["Algorithms", "System Design"]},
             "uber": {"type": "Big Tech", "difficulty": "Hard", "focus": ["Algorithms", "Problem Solving"]},
             "startup": {"type": "Startup", "difficulty": "Medium", "focus": ["Full Stack", "Adaptability"]},
-        }
+        })
+        
+        # Substring automaton over company keys for single-pass lookups
+        self._company_automaton = None
+        if ahocorasick is not None:
+            self._company_automaton = ahocorasick.Automaton()
+            for index, (key, profile) in enumerate(self.company_profiles.items()):
+                self._company_automaton.add_word(key, (index, profile))
+            self._company_automaton.make_automaton()
         
         # Skill mapping for topic extraction
         self.skill_mapping = {
@@ -99,65 +228,244 @@ class InterviewPrepAgent:
             "AWS": "Cloud Computing",
             "Docker": "DevOps"
         }
+        
+        # Parsed job descriptions by _jd_cache_key, backed by the shelve at JD_CACHE_PATH
+        self._skills_cache: "OrderedDict[str, ExtractedSkills]" = OrderedDict()
 
     def parse_job_description(self, job_description: str, role: str) -> ExtractedSkills:
         """Parse job description to extract skills and requirements"""
         
-        if self.demo_mode:
-            return self._demo_parse_skills(job_description, role)
+        skills, cache_key = self._known_skills(job_description, role)
+        if skills is not None:
+            return skills
         
-        prompt = f"""
-        Analyze this job description for {role} and extract information in JSON format:
+        try:
+            response = self.model.generate_content(_build_parse_prompt(job_description, role))
+        except Exception as e:
+            print(f"Error parsing job description: {e}")
+            return self._create_default_skills(role)
+        
+        return self._skills_from_response(response, role, cache_key)
 
-        {job_description}
+    def _known_skills(self, job_description: str, role: str) -> Tuple[Optional[ExtractedSkills], str]:
+        """Demo or cached skills for a job description (None if the model is needed), plus its cache key"""
+        
+        cache_key = _jd_cache_key(role, job_description)
+        
+        if self.demo_mode:
+            return self._demo_parse_skills(job_description, role), cache_key
+        
+        return self._get_cached_skills(cache_key), cache_key
 
-        Extract:
-        {{
-            "technical_skills": [list of technical skills],
-            "soft_skills": [list of soft skills],
-            "tools_technologies": [list of tools/technologies],
-            "responsibilities": [list of key responsibilities],
-            "experience_level": "Entry/Mid/Senior/Principal"
-        }}
-        """
+    def _skills_from_response(self, response: Any, role: str, cache_key: str) -> ExtractedSkills:
+        """Turn a single-description model response into skills, caching successful parses"""
         
         try:
-            response = self.model.generate_content(prompt)
-            json_match = re.search(r'\{.*\}', response.text, re.DOTALL)
+            parsed_data = _extract_json(response.text)
             
-            if json_match:
-                parsed_data = json.loads(json_match.group())
-                return ExtractedSkills(**parsed_data)
-            else:
+            if parsed_data is None:
                 return self._create_default_skills(role)
+            
+            skills = ExtractedSkills(**parsed_data)
                 
         except Exception as e:
             print(f"Error parsing job description: {e}")
             return self._create_default_skills(role)
+        
+        self._cache_skills(cache_key, skills)
+        return skills.model_copy(deep=True)
+
+    def _get_cached_skills(self, cache_key: str) -> Optional[ExtractedSkills]:
+        """Look up parsed skills in memory, then on disk; returns a copy the caller may modify"""
+        
+        skills = self._skills_cache.get(cache_key)
+        if skills is not None:
+            self._skills_cache.move_to_end(cache_key)
+        else:
+            skills = self._load_cached_skills(cache_key)
+            if skills is None:
+                return None
+            self._remember_skills(cache_key, skills)
+        
+        return skills.model_copy(deep=True)
+
+    def _cache_skills(self, cache_key: str, skills: ExtractedSkills):
+        """Record successfully parsed skills in memory and on disk"""
+        
+        self._remember_skills(cache_key, skills)
+        self._store_cached_skills(cache_key, skills)
+
+    def _remember_skills(self, cache_key: str, skills: ExtractedSkills):
+        """Keep skills in the in-memory cache, evicting the least recently used entry when full"""
+        
+        self._skills_cache[cache_key] = skills
+        self._skills_cache.move_to_end(cache_key)
+        if len(self._skills_cache) > JD_MEMORY_CACHE_SIZE:
+            self._skills_cache.popitem(last=False)
+
+    def _load_cached_skills(self, cache_key: str) -> Optional[ExtractedSkills]:
+        """Read previously parsed skills from the on-disk cache"""
+        
+        try:
+            with shelve.open(JD_CACHE_PATH, flag='r') as cache:
+                data = cache.get(cache_key)
+        except Exception:
+            return None  # Cache missing or unreadable, parse again
+        
+        if data is None:
+            return None
+        
+        try:
+            return ExtractedSkills(**data)
+        except (ValidationError, TypeError):
+            # Stale entry from an older format, drop it and parse again
+            self._discard_cached_skills(cache_key)
+            return None
+
+    def _discard_cached_skills(self, cache_key: str):
+        """Remove an unusable entry from the on-disk cache"""
+        
+        try:
+            with shelve.open(JD_CACHE_PATH) as cache:
+                cache.pop(cache_key, None)
+        except Exception:
+            pass  # Best effort, the entry is simply ignored again next time
+
+    def _store_cached_skills(self, cache_key: str, skills: ExtractedSkills):
+        """Persist parsed skills so later runs skip the model call"""
+        
+        try:
+            os.makedirs(os.path.dirname(JD_CACHE_PATH), exist_ok=True)
+            with shelve.open(JD_CACHE_PATH) as cache:
+                cache[cache_key] = skills.model_dump()
+        except Exception as e:
+            print(f"Could not update job description cache: {e}")
+
+    async def parse_job_description_async(self, job_description: str, role: str,
+                                          semaphore: Optional[asyncio.Semaphore] = None) -> ExtractedSkills:
+        """Async variant of parse_job_description so independent calls can overlap"""
+        
+        skills, cache_key = self._known_skills(job_description, role)
+        if skills is not None:
+            return skills
+        
+        try:
+            response = await self._generate_content_async(_build_parse_prompt(job_description, role), semaphore)
+        except Exception as e:
+            print(f"Error parsing job description: {e}")
+            return self._create_default_skills(role)
+        
+        return self._skills_from_response(response, role, cache_key)
+
+    async def _generate_content_async(self, prompt: str, semaphore: Optional[asyncio.Semaphore]) -> Any:
+        """Call the model, holding a semaphore slot for the duration of the request when given one"""
+        
+        if semaphore is None:
+            return await self.model.generate_content_async(prompt)
+        
+        async with semaphore:
+            return await self.model.generate_content_async(prompt)
+
+    async def parse_job_descriptions_batch_async(self, jobs: List[JobInput],
+                                                 semaphore: Optional[asyncio.Semaphore] = None) -> List[ExtractedSkills]:
+        """Parse several job descriptions with a single model call"""
+        
+        if self.demo_mode:
+            return [self._demo_parse_skills(job.job_description, job.role) for job in jobs]
+        
+        cache_keys = [_jd_cache_key(job.role, job.job_description) for job in jobs]
+        results = [self._get_cached_skills(cache_key) for cache_key in cache_keys]
+        pending = [i for i, skills in enumerate(results) if skills is None]
+        
+        if len(pending) == 1:
+            job = jobs[pending[0]]
+            results[pending[0]] = await self.parse_job_description_async(job.job_description, job.role, semaphore)
+        elif pending:
+            for i, skills in zip(pending, await self._parse_batch_uncached([jobs[i] for i in pending], semaphore)):
+                results[i] = skills
+        
+        return results
+
+    async def _parse_batch_uncached(self, jobs: List[JobInput],
+                                    semaphore: Optional[asyncio.Semaphore]) -> List[ExtractedSkills]:
+        """Send one batched prompt for jobs missing from the cache, falling back to single parses"""
+        
+        descriptions = "\n\n".join(
+            f"===JD {i}===\nRole: {job.role}\n{job.job_description.strip()}"
+            for i, job in enumerate(jobs, 1)
+        )
+        prompt = _BATCH_PARSE_PROMPT.format(count=len(jobs), descriptions=descriptions, json_format=_SKILLS_JSON_FORMAT)
+        
+        try:
+            response = await self._generate_content_async(prompt, semaphore)
+            parsed_data = _extract_json(response.text, '[')
+            
+            if parsed_data is not None and len(parsed_data) == len(jobs):
+                batch = [ExtractedSkills(**item) for item in parsed_data]
+                for job, skills in zip(jobs, batch):
+                    self._cache_skills(_jd_cache_key(job.role, job.job_description), skills)
+                return [skills.model_copy(deep=True) for skills in batch]
+            
+            print("Batch response did not match job count, parsing individually")
+                
+        except Exception as e:
+            print(f"Error parsing job descriptions batch: {e}")
+        
+        return list(await asyncio.gather(
+            *[self.parse_job_description_async(job.job_description, job.role, semaphore) for job in jobs]
+        ))
+
+    async def parse_job_descriptions_async(self, jobs: List[JobInput], row_marshal_batch: int = 4) -> List[ExtractedSkills]:
+        """Parse jobs in batches of row_marshal_batch per prompt, sending the batches concurrently"""
+        
+        if row_marshal_batch < 1:
+            raise ValueError(f"row_marshal_batch must be at least 1, got {row_marshal_batch}")
+        
+        # Held per model call, so fallback single parses also count against the cap
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        
+        chunks = [jobs[start:start + row_marshal_batch] for start in range(0, len(jobs), row_marshal_batch)]
+        results = await asyncio.gather(*[self.parse_job_descriptions_batch_async(chunk, semaphore) for chunk in chunks])
+        
+        return [skills for chunk_skills in results for skills in chunk_skills]
 
     def research_company(self, company_name: str, role: str) -> CompanyInsights:
         """Research company interview process"""
         
-        company_key = company_name.lower().replace(" ", "")
-        company_profile = None
-        
-        # Check database
-        for key, profile in self.company_profiles.items():
-            if key in company_key:
-                company_profile = profile
-                break
+        company_key = self._normalize_company(company_name)
+        company_profile = self._lookup_company_profile(company_key)
         
         if not company_profile:
             company_profile = {"type": "Unknown", "difficulty": "Medium", "focus": ["Technical Skills"]}
         
-        return CompanyInsights(
+        return CompanyInsights.model_construct(
             company_name=company_name,
             company_type=company_profile["type"],
             typical_rounds=["Screening", "Technical", "System Design", "Behavioral", "Manager"],
             difficulty_level=company_profile["difficulty"],
-            interview_focus=company_profile["focus"]
+            interview_focus=list(company_profile["focus"])
         )
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _normalize_company(name: str) -> str:
+        """Normalize a company name into a lookup key"""
+        
+        return name.lower().replace(" ", "").replace("-", "")
+
+    def _lookup_company_profile(self, company_key: str) -> Optional[Dict[str, Any]]:
+        """Find the earliest listed profile whose key appears in the normalized company name"""
+        
+        if self._company_automaton is not None:
+            matches = [value for _, value in self._company_automaton.iter(company_key)]
+            return min(matches, key=lambda match: match[0])[1] if matches else None
+        
+        # Check database
+        for key, profile in self.company_profiles.items():
+            if key in company_key:
+                return profile
+        return None
+
     def generate_roadmap(self, job_input: JobInput) -> Roadmap:
         """Generate comprehensive preparation roadmap"""
         
@@ -165,6 +473,24 @@ class InterviewPrepAgent:
         
         # Step 1: Parse job description
         extracted_skills = self.parse_job_description(job_input.job_description, job_input.role)
+        
+        return self.build_roadmap(job_input, extracted_skills)
+
+    def generate_roadmaps_batch(self, jobs: List[JobInput], row_marshal_batch: int = 4) -> List[Roadmap]:
+        """Generate roadmaps for several jobs, parsing up to row_marshal_batch descriptions per model call"""
+        
+        extracted = asyncio.run(self.parse_job_descriptions_async(jobs, row_marshal_batch))
+        
+        roadmaps = []
+        for job_input, skills in zip(jobs, extracted):
+            print(f"🚀 Analyzing {job_input.role} at {job_input.company_name}...")
+            roadmaps.append(self.build_roadmap(job_input, skills))
+        
+        return roadmaps
+
+    def build_roadmap(self, job_input: JobInput, extracted_skills: ExtractedSkills) -> Roadmap:
+        """Assemble a roadmap from already extracted skills"""
+        
         print(f"✅ Extracted {len(extracted_skills.technical_skills)} technical skills")
         
         # Step 2: Research company
@@ -184,7 +510,7 @@ class InterviewPrepAgent:
         resources = self._generate_resources()
         
         # Step 7: Identify key skills
-        key_skills = extracted_skills.technical_skills[:3] + company_insights.interview_focus[:2]
+        key_skills = list(dict.fromkeys(extracted_skills.technical_skills[:3] + company_insights.interview_focus[:2]))
         
         return Roadmap(
             company=job_input.company_name,
@@ -193,31 +519,20 @@ class InterviewPrepAgent:
             rounds=rounds,
             recommended_order=prep_order,
             preparation_timeline=timeline,
-            key_skills=list(set(key_skills)),
+            key_skills=key_skills,
             resources=resources
         )
 
     def _generate_rounds(self, skills: ExtractedSkills, company: CompanyInsights) -> List[InterviewRound]:
         """Generate interview rounds based on company and skills"""
         
-        rounds = []
-        
-        if company.company_type in ["FAANG", "Big Tech"]:
-            rounds = [
-                InterviewRound(type="Phone Screening", topics=["Resume", "Basic Technical"], duration="30 min"),
-                InterviewRound(type="Coding Round 1", topics=["Arrays", "Strings", "Hash Maps"], duration="45 min"),
-                InterviewRound(type="Coding Round 2", topics=["Dynamic Programming", "Graphs"], duration="45 min"),
-                InterviewRound(type="System Design", topics=["Scalability", "Database Design"], duration="60 min"),
-                InterviewRound(type="Behavioral", topics=["Leadership", "Teamwork"], duration="30 min")
-            ]
-        else:
-            rounds = [
-                InterviewRound(type="Initial Screening", topics=["Background", "Interest"], duration="30 min"),
-                InterviewRound(type="Technical Interview", topics=["Problem Solving", "Code Review"], duration="60 min"),
-                InterviewRound(type="Manager Round", topics=["Experience", "Culture Fit"], duration="45 min")
-            ]
+        templates = BIG_TECH_ROUNDS if company.company_type in ["FAANG", "Big Tech"] else STANDARD_ROUNDS
         
-        return rounds
+        # Values are fixed, so skip validation
+        return [
+            InterviewRound.model_construct(type=round_type, topics=list(topics), duration=duration)
+            for round_type, topics, duration in templates
+        ]
 
     def _generate_prep_order(self, skills: ExtractedSkills, company: CompanyInsights, role: str) -> List[str]:
         """Generate recommended preparation order"""
@@ -241,10 +556,7 @@ class InterviewPrepAgent:
     def _estimate_timeline(self, difficulty: str, experience: str) -> str:
         """Estimate preparation timeline"""
         
-        base_weeks = {"Easy": 4, "Medium": 8, "Hard": 12}
-        multiplier = {"Entry": 1.5, "Mid": 1.0, "Senior": 0.8}.get(experience, 1.0)
-        
-        weeks = int(base_weeks.get(difficulty, 8) * multiplier)
+        weeks = int(_BASE_WEEKS.get(difficulty, 8) * _EXPERIENCE_MULT.get(experience, 1.0))
         return f"{weeks} weeks"
 
     def _generate_resources(self) -> Dict[str, List[str]]:
@@ -259,7 +571,7 @@ class InterviewPrepAgent:
     def _create_default_skills(self, role: str) -> ExtractedSkills:
         """Create default skills when parsing fails"""
         
-        return ExtractedSkills(
+        return ExtractedSkills.model_construct(
             technical_skills=["Programming", "Problem Solving"],
             soft_skills=["Communication", "Teamwork"],
             tools_technologies=["Development Tools"],
@@ -270,13 +582,14 @@ class InterviewPrepAgent:
     def _demo_parse_skills(self, job_description: str, role: str) -> ExtractedSkills:
         """Demo mode parsing using keyword matching"""
         
-        jd_lower = job_description.lower()
-        
         # Extract technical skills based on keywords
-        tech_skills = []
-        for keyword in ["python", "java", "javascript", "react", "node.js", "sql", "aws", "docker", "kubernetes", "machine learning", "data structures", "algorithms"]:
-            if keyword in jd_lower:
-                tech_skills.append(keyword.title())
+        words = job_description.lower().translate(_PUNCT_TABLE).split()
+        tokens = set(words)
+        text = f" {' '.join(words)} "
+        tech_skills = [
+            keyword.title() for keyword, normalized, is_phrase in _DEMO_KEYWORD_MATCHERS
+            if (f" {normalized} " in text if is_phrase else normalized in tokens)
+        ]
         
         # Default skills if none found
         if not tech_skills:
@@ -286,13 +599,13 @@ class InterviewPrepAgent:
         experience = "Entry"
         if "senior" in role.lower() or "lead" in role.lower():
             experience = "Senior"
-        elif any(term in jd_lower for term in ["3+ years", "4+ years", "5+ years"]):
+        elif any(int(m.group(1)) >= 3 for m in _EXPERIENCE_RE.finditer(job_description)):
             experience = "Mid"
         
-        return ExtractedSkills(
+        return ExtractedSkills.model_construct(
             technical_skills=tech_skills,
             soft_skills=["Communication", "Teamwork", "Problem Solving", "Leadership"],
-            tools_technologies=tech_skills,
+            tools_technologies=list(tech_skills),
             responsibilities=["Software Development", "Code Review", "System Design"],
             experience_level=experience
         )
@@ -301,12 +614,17 @@ class InterviewPrepAgent:
         """Save roadmap to JSON file"""
         
         if filename is None:
+            from datetime import datetime
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"roadmap_{roadmap.company}_{roadmap.role}_{timestamp}.json"
             filename = filename.replace(" ", "_").replace("/", "_")
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(roadmap.model_dump(), f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(roadmap.model_dump(), option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(roadmap.model_dump(), f, indent=2, ensure_ascii=False)
         
         print(f"💾 Roadmap saved to: {filename}")
         return filename
@@ -314,22 +632,27 @@ class InterviewPrepAgent:
     def display_summary(self, roadmap: Roadmap):
         """Display formatted roadmap summary"""
         
-        print(f"\n🎯 INTERVIEW PREPARATION ROADMAP")
-        print(f"{'='*50}")
-        print(f"Company: {roadmap.company}")
-        print(f"Role: {roadmap.role}")
-        print(f"Difficulty: {roadmap.difficulty}")
-        print(f"Timeline: {roadmap.preparation_timeline}")
+        parts = [
+            f"\n🎯 INTERVIEW PREPARATION ROADMAP",
+            f"{'='*50}",
+            f"Company: {roadmap.company}",
+            f"Role: {roadmap.role}",
+            f"Difficulty: {roadmap.difficulty}",
+            f"Timeline: {roadmap.preparation_timeline}",
+            f"\n📊 INTERVIEW ROUNDS ({len(roadmap.rounds)} rounds)",
+        ]
         
-        print(f"\n📊 INTERVIEW ROUNDS ({len(roadmap.rounds)} rounds)")
         for i, round_info in enumerate(roadmap.rounds, 1):
-            print(f"{i}. {round_info.type}")
-            print(f"   Topics: {', '.join(round_info.topics)}")
+            parts.append(f"{i}. {round_info.type}\n   Topics: {', '.join(round_info.topics)}")
             if round_info.duration:
-                print(f"   Duration: {round_info.duration}")
+                parts.append(f"   Duration: {round_info.duration}")
         
-        print(f"\n🎯 KEY SKILLS: {', '.join(roadmap.key_skills)}")
-        print(f"\n📈 PREP ORDER: {' → '.join(roadmap.recommended_order)}")
+        parts.append(f"\n🎯 KEY SKILLS: {', '.join(roadmap.key_skills)}")
+        parts.append(f"\n📈 PREP ORDER: {' → '.join(roadmap.recommended_order)}")
+        
+        # Single write instead of one print per line
+        sys.stdout.write("\n".join(parts) + "\n")
+        sys.stdout.flush()
 
 def interactive_mode(agent):
     """Interactive mode for custom job analysis"""
@@ -337,33 +660,41 @@ def interactive_mode(agent):
     print("\n🎯 INTERACTIVE JOB ANALYSIS MODE")
     print("="*50)
     
+    piped = not sys.stdin.isatty()
+    
     while True:
         print("\nEnter job details (or 'quit' to exit):")
         
         # Get user input
-        company_name = input("🏢 Company Name: ").strip()
-        if company_name.lower() == 'quit':
-            break
-            
-        role = input("💼 Job Role: ").strip()
-        if role.lower() == 'quit':
-            break
+        try:
+            company_name = input("🏢 Company Name: ").strip()
+            if company_name.lower() == 'quit':
+                break
+                
+            role = input("💼 Job Role: ").strip()
+            if role.lower() == 'quit':
+                break
+        except EOFError:
+            break  # Input closed
             
-        print("📋 Job Description (press Enter twice when done):")
-        job_description_lines = []
-        while True:
-            line = input()
-            if line == "":
-                if job_description_lines and job_description_lines[-1] == "":
-                    break
-                job_description_lines.append("")
-            else:
-                job_description_lines.append(line)
-        
-        job_description = "\n".join(job_description_lines).strip()
+        if piped:
+            # Piped input: the rest of stdin is the job description
+            print("📋 Job Description (reading until end of input):")
+            job_description = sys.stdin.read().strip()
+        else:
+            print("📋 Job Description (paste it, then enter a line with only '.' when done):")
+            job_description_lines = []
+            try:
+                for line in iter(input, "."):
+                    job_description_lines.append(line)
+            except EOFError:
+                pass  # Ctrl-D also ends the description
+            job_description = "\n".join(job_description_lines).strip()
         
         if not job_description:
             print("❌ Job description cannot be empty!")
+            if piped:
+                break
             continue
         
         # Create job input
@@ -383,22 +714,21 @@ def interactive_mode(agent):
         
         # Ask if user wants to continue
         print(f"\n✅ Analysis complete! Roadmap saved as {filename}")
-        continue_choice = input("\n🔄 Analyze another job? (y/n): ").strip().lower()
+        if piped:
+            break
+        try:
+            continue_choice = input("\n🔄 Analyze another job? (y/n): ").strip().lower()
+        except EOFError:
+            break
         if continue_choice not in ['y', 'yes']:
             break
 
-def demo_samples_mode(agent):
-    """Demo mode with multiple sample job descriptions"""
-    
-    print("\n🎭 DEMO MODE - Testing with Sample Job Descriptions")
-    print("="*60)
-    
-    # Sample job descriptions
-    samples = [
-        {
-            "company": "Google",
-            "role": "Software Engineer (SDE-1)",
-            "description": """
+# Sample job descriptions for demo samples mode
+SAMPLES = (
+    {
+        "company": "Google",
+        "role": "Software Engineer (SDE-1)",
+        "description": """
 Software Engineer - Google
 
 We are looking for a Software Engineer to join our team and help build the next generation of products.
@@ -418,12 +748,12 @@ Requirements:
 - Knowledge of web technologies (HTTP, REST APIs, JSON)
 - Experience with databases (SQL, NoSQL)
 - Strong problem-solving skills
-            """
-        },
-        {
-            "company": "Microsoft",
-            "role": "Data Scientist",
-            "description": """
+        """
+    },
+    {
+        "company": "Microsoft",
+        "role": "Data Scientist",
+        "description": """
 Data Scientist - Microsoft Azure AI
 
 Join our Azure AI team to build intelligent solutions with AI and machine learning.
@@ -444,12 +774,12 @@ Requirements:
 - Experience with big data technologies (Spark, Hadoop)
 - Knowledge of cloud platforms (Azure preferred)
 - Strong communication skills
-            """
-        },
-        {
-            "company": "TechFlow (Startup)",
-            "role": "Full Stack Developer",
-            "description": """
+        """
+    },
+    {
+        "company": "TechFlow (Startup)",
+        "role": "Full Stack Developer",
+        "description": """
 Full Stack Developer - TechFlow (YC-backed startup)
 
 Fast-growing fintech startup building the future of financial technology.
@@ -474,26 +804,42 @@ Requirements:
 - Database experience with SQL databases
 - Understanding of RESTful APIs and microservices
 - Experience with cloud platforms (AWS preferred)
-            """
-        }
-    ]
+        """
+    }
+)
+
+def demo_samples_mode(agent):
+    """Demo mode with multiple sample job descriptions"""
     
-    for i, sample in enumerate(samples, 1):
-        print(f"\n🧪 Test {i}: {sample['company']} - {sample['role']}")
-        print("-" * 60)
-        
-        job_input = JobInput(
+    print("\n🎭 DEMO MODE - Testing with Sample Job Descriptions")
+    print("="*60)
+    
+    jobs = [
+        JobInput(
             company_name=sample["company"],
             role=sample["role"],
             job_description=sample["description"]
         )
+        for sample in SAMPLES
+    ]
+    
+    # Parse all samples up front, batched into concurrent model calls
+    extracted = asyncio.run(agent.parse_job_descriptions_async(jobs))
+    
+    for i, (job_input, skills) in enumerate(zip(jobs, extracted), 1):
+        print(f"\n🧪 Test {i}: {job_input.company_name} - {job_input.role}")
+        print("-" * 60)
         
-        roadmap = agent.generate_roadmap(job_input)
+        print(f"🚀 Analyzing {job_input.role} at {job_input.company_name}...")
+        roadmap = agent.build_roadmap(job_input, skills)
         agent.display_summary(roadmap)
         agent.save_roadmap(roadmap)
         
-        if i < len(samples):
-            input("\n⏳ Press Enter to continue to next test...")
+        if i < len(SAMPLES):
+            try:
+                input("\n⏳ Press Enter to continue to next test...")
+            except EOFError:
+                pass  # Input closed, run the remaining samples without pausing
 
 def main():
     """Enhanced main function with multiple modes"""
@@ -514,7 +860,10 @@ def main():
             print("4. 📊 Show JSON Output (Latest roadmap)")
             print("5. 🚪 Exit")
             
-            choice = input("\nEnter your choice (1-5): ").strip()
+            try:
+                choice = input("\nEnter your choice (1-5): ").strip()
+            except EOFError:
+                choice = "5"  # Input closed (piped or Ctrl-D), exit cleanly
             
             if choice == "1":
                 interactive_mode(agent)
@@ -549,10 +898,14 @@ Requirements:
                 demo_samples_mode(agent)
             elif choice == "4":
                 # Show latest JSON file
-                import glob
-                json_files = glob.glob("roadmap_*.json")
-                if json_files:
-                    latest_file = max(json_files, key=lambda x: os.path.getctime(x))
+                with os.scandir('.') as entries:
+                    latest_entry = max(
+                        (e for e in entries if e.name.startswith('roadmap_') and e.name.endswith('.json')),
+                        key=lambda e: e.stat().st_mtime,
+                        default=None
+                    )
+                if latest_entry is not None:
+                    latest_file = latest_entry.name
                     print(f"\n📄 Latest Roadmap JSON: {latest_file}")
                     print("-" * 50)
                     with open(latest_file, 'r') as f: